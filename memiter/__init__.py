@@ -6,12 +6,44 @@ Author: Udi Shalev <azsd91@gmail.com>
 Version: 0.1.0
 """
 
-from copy import deepcopy
-from itertools import islice
-from typing import Callable, Generic, Iterable, TypeVar
+from itertools import compress, islice, repeat, tee
+from operator import eq, mod
+from typing import Any, Callable, Generic, Iterable, Iterator, Sequence, TypeVar
+
+from memiter import _jit
 
 T = TypeVar("T")
 
+SEQUENCE_TYPES = (list, tuple, range)
+
+
+def _as_sequence(iterable: Iterable[T]) -> "Sequence[T] | None":
+    """Return the iterable when it can be sliced and iterated again, `None` otherwise.
+
+    Exact types only, subclasses may override `__iter__`.
+    """
+    if isinstance(iterable, SEQUENCE_TYPES) and type(iterable) in SEQUENCE_TYPES:
+        return iterable
+
+    return None
+
+
+def _map_op(
+    op_arg: tuple[Callable[[Any, Any], Any], Any], iterable: Iterable[T]
+) -> Iterator[Any]:
+    """Map the iterable with `op(x, arg)`, entirely at C level for builtin operators."""
+    op, arg = op_arg
+    return map(op, iterable, repeat(arg))
+
+
+def _filter_mod_eq(
+    modulus_remainder: tuple[int, int], iterable: Iterable[T]
+) -> Iterator[T]:
+    """Filter the iterable to `x % modulus == remainder`, entirely at C level."""
+    modulus, remainder = modulus_remainder
+    values, keys = tee(iterable, 2)
+    return compress(values, map(eq, map(mod, keys, repeat(modulus)), repeat(remainder)))
+
 
 class memiter(Generic[T]):  # noqa: N801
     """Extends the functionality of a generator.
@@ -22,7 +54,7 @@ class memiter(Generic[T]):  # noqa: N801
         - Limit the number of elements that are generated.
         - Set the current page.
 
-    - Access the data that has been generated.
+    - Access the data that has been generated, cached until the generator is altered.
 
     - Keeps the original generator. allowing to generate the data again.
 
@@ -51,6 +83,21 @@ class memiter(Generic[T]):  # noqa: N801
 
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_collecting",
+        "_data",
+        "_limit",
+        "_ops",
+        "_page",
+        "_sequence",
+        "_source",
+        "_start",
+        "_stop",
+        "generator",
+        "original_iterable",
+    )
+
     def __init__(self, iterable: Iterable[T]) -> None:
         """Initialize the memiter instance.
 
@@ -59,16 +106,19 @@ class memiter(Generic[T]):  # noqa: N801
             iterable (Iterable[T]): The iterable object to create a memiter instance from.
 
         """
-        assert isinstance(iterable, Iterable), "Input must be an iterable."
-
         self._page = 1
         self._limit: int | None = None
-        self._first_iteration = True
-        self._generator_copy = iter(iterable)
+        self._start = 0
+        self._stop: int | None = None
+        # A tee snapshot that is never advanced, so one-shot iterators can be replayed after a reset.
+        self._source = tee(iterable, 1)[0]
+        self._sequence: Sequence[T] | None = _as_sequence(iterable)
+        self._ops: list[tuple[Callable[..., Iterator[Any]], Any]] = []
+        self._data: list[T] | None = None
+        self._collecting: list[T] | None = None
 
-        self.data: list[T] = []
         self.original_iterable = iterable
-        self.generator = self._generator_copy
+        self.generator: Iterator[T] | None = None
 
     def __iter__(self) -> "memiter[T]":
         """Return the generator itself."""
@@ -76,41 +126,123 @@ class memiter(Generic[T]):  # noqa: N801
 
     def __next__(self) -> T:
         """Return the next value from the generator."""
-        if self._first_iteration:
-            self._generator_copy = deepcopy(self.generator)
-            self._add_pagination(self.generator)
-            self._first_iteration = False
+        generator = self.generator
+        if generator is None:
+            generator = self.generator = self._collect_into_data(self._build_pipeline())
 
         try:
-            value = next(self.generator)
-            self.data.append(value)
+            return next(generator)
         except StopIteration:
-            self.generator = self._generator_copy
-            self._first_iteration = True
+            self._reset_generator()
             raise
 
-        return value
+    @property
+    def data(self) -> list[T]:
+        """The data of the current limit and page.
 
-    def _add_pagination(self, iterable: Iterable[T]) -> None:
-        """Reset the generator according to the current limit and page."""
-        start = (self._page - 1) * self._limit if self._limit is not None else 0
-        stop = start + self._limit if self._limit is not None else None
-        self.generator = islice(iterable, start, stop)
+        ### Note:
+        ----
+        - Holds the generated elements after a complete iteration, without running the generator again.
+        - Otherwise generated on first access, holding the whole page regardless of the elements consumed with `next`.
+        - - generating runs the filter and map functions again.
+        - Cached until the generator is altered.
 
-    def _reset_from_copy(self) -> None:
-        """Reset the generator from the copy."""
-        self.generator = self._generator_copy
-        self._first_iteration = True
+        """
+        if self._data is None:
+            self._data = list(self._build_pipeline())
+
+        return self._data
+
+    def _build_pipeline(self) -> Iterator[T]:
+        """Build a new iterator over the source, with the recorded operations and pagination applied."""
+        if self._sequence is None:
+            self._source, iterator = tee(self._source, 2)
+        elif self._stop is not None and not self._ops:
+            # Slicing the sequence allocates the page at its exact size.
+            return iter(self._sequence[self._start : self._stop])
+        else:
+            # Sequences can be iterated again, no snapshot is needed.
+            iterator = iter(self._sequence)
+
+        for op, func in self._ops:
+            iterator = op(func, iterator)
+
+        return self._add_pagination(iterator)
+
+    def _collect(self) -> list[T]:
+        """Generate the remaining data in a single pass and reset the generator."""
+        if self.generator is None:
+            self._data = values = list(self._build_pipeline())
+            return values
+
+        values = list(self.generator)
+        self._reset_generator()
+        return values
+
+    def _add_pagination(self, iterable: Iterable[T]) -> Iterator[T]:
+        """Return the iterable according to the current limit and page."""
+        return islice(iterable, self._start, self._stop)
+
+    def _set_bounds(self) -> None:
+        """Compute the slice bounds of the current limit and page."""
+        self._start = (self._page - 1) * self._limit if self._limit is not None else 0
+        self._stop = self._start + self._limit if self._limit is not None else None
+
+    def _add_op(self, op: Callable[..., Iterator[Any]], func: Any) -> None:
+        """Record an operation, also applying it to the rest of an iteration in progress."""
+        self._invalidate_data()
+        self._ops.append((op, func))
+
+        if self.generator is not None:
+            self.generator = op(func, self.generator)
+
+    def _collect_into_data(self, iterator: Iterator[T]) -> Iterator[T]:
+        """Yield from the iterator, keeping the values as `self`.data once it is exhausted.
+
+        The values are dropped if the generator is altered during the iteration.
+        """
+        values: list[T] = []
+        self._collecting = values
+        append = values.append
+
+        for value in iterator:
+            append(value)
+            yield value
+
+        if self._collecting is values:
+            self._data = values
+            self._collecting = None
+
+    def _invalidate_data(self) -> None:
+        """Drop the data, and the data of an iteration in progress."""
+        self._data = None
+        self._collecting = None
+
+    def _reset_generator(self) -> None:
+        """Rebuild the generator on the next iteration."""
+        self.generator = None
+
+    def _replace_source(self, values: list[T]) -> None:
+        """Replace the source with generated values, which already have the operations and pagination applied."""
+        self._page = 1
+        self._limit = None
+        self._set_bounds()
+        self.generator = None
+        self._sequence = values
+        self._ops = []
+        # Not shared with the source, so mutating `data` cannot change what is replayed.
+        self._invalidate_data()
 
     ## Altering Methods
     def reset(self) -> "memiter[T]":
         """Reset the generator to the original iterable."""
         self._page = 1
         self._limit = None
-        self._first_iteration = True
-        self.generator = iter(self.original_iterable)
-        self._add_pagination(self.original_iterable)
-        self.data.clear()
+        self._set_bounds()
+        self.generator = None
+        self._sequence = _as_sequence(self.original_iterable)
+        self._ops = []
+        self._invalidate_data()
         return self
 
     def limit(self, n: int) -> "memiter[T]":
@@ -155,7 +287,8 @@ class memiter(Generic[T]):  # noqa: N801
         assert n > 0, "number must be greater than 0."
 
         self._limit = n
-        self.data.clear()
+        self._set_bounds()
+        self._invalidate_data()
         return self
 
     def page(self, n: int) -> "memiter[T]":
@@ -198,16 +331,25 @@ class memiter(Generic[T]):  # noqa: N801
         assert n > 0, "number must be greater than 0."
 
         self._page = n
-        self.data.clear()
+        self._set_bounds()
+        self._invalidate_data()
         return self
 
-    def filter(self, func: Callable[[T], bool] = lambda x: True) -> "memiter[T]":  # noqa: ARG005
+    def filter(
+        self,
+        func: Callable[[T], bool] = lambda x: True,  # noqa: ARG005
+        vectorized: bool = False,
+    ) -> "memiter[T]":
         """Filter the elements that are generated.
 
         ### Note:
         ----
         - Resets the previous generator data.
         - `self`.data will hold the last data that was generated.
+        - With `vectorized`, numeric data is filtered with a mask computed by a single numpy expression.
+        - - Requires numpy, consumes to the end of the generator when the pipeline is built.
+        - - Falls back to filtering element by element when numpy is missing or the predicate does not vectorize.
+        - - Computes with fixed width numpy types, integers wrap around at 64 bits instead of growing.
 
         ### Example:
         ----
@@ -220,9 +362,17 @@ class memiter(Generic[T]):  # noqa: N801
         >>> my_gen.data
         [0, 2, 4, 6, 8]
 
+        - Filter the even numbers with a vectorized mask.
+
+        >>> my_gen = memiter(range(10))
+        >>> _ = list(my_gen.filter(lambda x: x % 2 == 0, vectorized=True))
+        >>> my_gen.data
+        [0, 2, 4, 6, 8]
+
         ### Args:
         ----
             func (Callable[[T], bool]): The function to filter the elements.
+            vectorized (bool): Whether `func` also works on a whole numpy array, returning a boolean mask.
 
         ### Returns:
         -------
@@ -231,7 +381,10 @@ class memiter(Generic[T]):  # noqa: N801
         """
         assert callable(func), "func must be a callable."
 
-        self.generator = filter(func, self.generator)
+        if vectorized:
+            self._add_op(_jit.vectorized_filter, func)
+        else:
+            self._add_op(filter, func)
         return self
 
     def map(self, func: Callable[[T], T] = lambda x: x) -> "memiter[T]":
@@ -259,7 +412,144 @@ class memiter(Generic[T]):  # noqa: N801
         """
         assert callable(func), "func must be a callable."
 
-        self.generator = map(func, self.generator)
+        self._add_op(map, func)
+        return self
+
+    def map_op(self, op: Callable[[T, Any], T], arg: Any) -> "memiter[T]":
+        """Map the elements that are generated with a binary operator, `op(element, arg)`.
+
+        ### Note:
+        ----
+        - With a builtin operator (e.g. `operator.mul`), no Python function is called per element.
+        - - faster than the equivalent `map(lambda x: x * 2)`.
+
+        ### Example:
+        ----
+
+        - Multiply each element by 2.
+
+        >>> import operator
+        >>> from memiter import memiter
+        >>> my_gen = memiter(range(5))
+        >>> list(my_gen.map_op(operator.mul, 2))
+        [0, 2, 4, 6, 8]
+
+        ### Args:
+        ----
+            op (Callable[[T, Any], T]): The binary operator, called with the element first.
+            arg (Any): The second operand.
+
+        ### Returns:
+        -------
+            memiter[T]: The current memiter instance.
+
+        """
+        assert callable(op), "op must be a callable."
+
+        self._add_op(_map_op, (op, arg))
+        return self
+
+    def filter_mod_eq(self, modulus: int, remainder: int = 0) -> "memiter[T]":
+        """Filter the elements that are generated to those where `element % modulus == remainder`.
+
+        ### Note:
+        ----
+        - No Python function is called per element.
+        - - faster than the equivalent `filter(lambda x: x % 2 == 0)`.
+
+        ### Example:
+        ----
+
+        - Filter the even numbers from the generator.
+
+        >>> from memiter import memiter
+        >>> my_gen = memiter(range(10))
+        >>> list(my_gen.filter_mod_eq(2))
+        [0, 2, 4, 6, 8]
+
+        ### Args:
+        ----
+            modulus (int): The modulus to divide the elements by.
+            remainder (int): The remainder to keep, default is 0.
+
+        ### Returns:
+        -------
+            memiter[T]: The current memiter instance.
+
+        """
+        assert modulus != 0, "modulus must not be 0."
+
+        self._add_op(_filter_mod_eq, (modulus, remainder))
+        return self
+
+    def filter_jit(self, func: Callable[[T], bool]) -> "memiter[T]":
+        """Filter the elements that are generated, with a predicate compiled by numba.
+
+        ### Note:
+        ----
+        - Requires numba and numpy, install them with `pip install memiter[jit]`.
+        - Consumes to the end of the generator when the pipeline is built.
+        - Falls back to the regular `filter` when the elements are not numeric.
+        - Computes with fixed width numpy types, integers wrap around at 64 bits instead of growing.
+
+        ### Example:
+        ----
+
+        - Filter the even numbers from the generator.
+
+        >>> from memiter import memiter
+        >>> my_gen = memiter(range(10))
+        >>> _ = list(my_gen.filter_jit(lambda x: x % 2 == 0))
+        >>> my_gen.data
+        [0, 2, 4, 6, 8]
+
+        ### Args:
+        ----
+            func (Callable[[T], bool]): The function to filter the elements, must be supported by numba.
+
+        ### Returns:
+        -------
+            memiter[T]: The current memiter instance.
+
+        """
+        assert callable(func), "func must be a callable."
+
+        self._add_op(_jit.jit_filter, _jit.compile_func(func))
+        return self
+
+    def map_jit(self, func: Callable[[T], T]) -> "memiter[T]":
+        """Map the elements that are generated, with a function compiled by numba.
+
+        ### Note:
+        ----
+        - Requires numba and numpy, install them with `pip install memiter[jit]`.
+        - Consumes to the end of the generator when the pipeline is built.
+        - Falls back to the regular `map` when the elements are not numeric.
+        - Computes with fixed width numpy types, integers wrap around at 64 bits instead of growing.
+
+        ### Example:
+        ----
+
+        - Multiply each element by 2.
+
+        >>> from memiter import memiter
+        >>> my_gen = memiter(range(10))
+        >>> _ = list(my_gen.map_jit(lambda x: x * 2))
+        >>> my_gen.data
+        [0, 2, 4, 6, 8, 10, 12, 14, 16, 18]
+
+        ### Args:
+        ----
+            func (Callable[[T], T]): The function to map the elements, must be supported by numba.
+
+        ### Returns:
+        -------
+            memiter[T]: The current memiter instance.
+
+        """
+        assert callable(func), "func must be a callable."
+
+        self._add_op(_jit.jit_map, _jit.compile_func(func))
         return self
 
     def order_by(self, func: Callable[[T], T] = lambda x: x) -> "memiter[T]":
@@ -295,13 +585,41 @@ class memiter(Generic[T]):  # noqa: N801
         """
         assert callable(func), "func must be a callable."
 
-        self.data.clear()
+        values = self._collect()
+        values.sort(key=func)  # type: ignore [arg-type]
+        self._replace_source(values)
 
-        for _ in self:
-            continue
+        return self
 
-        self.generator = iter(sorted(self.data, key=func))  # type: ignore [arg-type]
+    def cache(self) -> "memiter[T]":
+        """Generate the data once and replay it from memory on the next iterations.
 
+        ### Note:
+        ----
+
+        - Consumes to the end of the generator.
+        - The current limit, page, filters and maps are baked into the cached data.
+        - - further altering methods are applied on top of the cached data.
+        - `reset` still goes back to the original iterable.
+
+        ### Example:
+        ----
+
+        - Cache the second page, then filter it.
+
+        >>> from memiter import memiter
+        >>> my_gen = memiter(range(10)).limit(5).page(2).cache()
+        >>> list(my_gen)
+        [5, 6, 7, 8, 9]
+        >>> list(my_gen.filter(lambda x: x % 2 == 0))
+        [6, 8]
+
+        ### Returns:
+        -------
+            memiter[T]: The current memiter instance.
+
+        """
+        self._replace_source(list(self._build_pipeline()))
         return self
 
     ## Access Methods
@@ -332,15 +650,12 @@ class memiter(Generic[T]):  # noqa: N801
             T | None: The first element of the generator. If the generator is empty, returns None.
 
         """
-        self.data.clear()
+        for first_item in self._build_pipeline():
+            self._data = [first_item]
+            return first_item
 
-        try:
-            first_item = next(self)
-        except StopIteration:
-            first_item = None
-
-        self._reset_from_copy()
-        return first_item
+        self._data = []
+        return None
 
     def last(self) -> T | None:
         """Return the last element of the generator.
@@ -370,10 +685,55 @@ class memiter(Generic[T]):  # noqa: N801
             T | None: The last element of the generator. If the generator is empty, returns None.
 
         """
-        self.data.clear()
+        self._data = values = list(self._build_pipeline())
+        return values[-1] if values else None
+
+    def batches(self, chunk_size: int, store: bool = False) -> Iterator[list[T]]:
+        """Generate the data in chunks of `chunk_size` elements.
+
+        ### Note:
+        ----
+
+        - Does not accumulate the chunks in `self`.data by default.
+        - - one-shot iterator sources (e.g. generators) are still buffered in memory, so they can be generated again.
+        - With `store`, `self`.data will hold all the elements that were generated once the chunks are exhausted.
+
+        ### Example:
+        ----
+
+        - Generate the data in chunks of 3 elements.
+
+        >>> from memiter import memiter
+        >>> my_gen = memiter(range(10))
+        >>> list(my_gen.batches(3))
+        [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+
+        ### Args:
+        ----
+            chunk_size (int): The number of elements in each chunk.
+            store (bool): Whether to keep the generated elements in `self`.data.
+
+        ### Returns:
+        -------
+            Iterator[list[T]]: The chunks of elements, the last chunk may be shorter.
+
+        """
+        assert isinstance(chunk_size, int), "chunk_size must be an integer."
+        assert chunk_size > 0, "chunk_size must be greater than 0."
+
+        return self._batches(self._build_pipeline(), chunk_size, store)
+
+    def _batches(
+        self, iterator: Iterator[T], chunk_size: int, store: bool
+    ) -> Iterator[list[T]]:
+        """Yield the chunks of the iterator, storing them in `self`.data once exhausted if requested."""
+        data: list[T] = []
+
+        while chunk := list(islice(iterator, chunk_size)):
+            if store:
+                data.extend(chunk)
 
-        last_item = None
-        for item in self:
-            last_item = item
+            yield chunk
 
-        return last_item
+        if store:
+            self._data = data
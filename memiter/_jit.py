@@ -0,0 +1,161 @@
+"""
+Compiled and vectorized operations for numeric memiter pipelines.
+
+numba and numpy are optional dependencies, imported on first use.
+Install them with `pip install memiter[jit]`.
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import compress
+from typing import Any, Callable, Hashable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+NUMERIC_KINDS = "biuf"
+CACHE_SIZE = 128
+
+_compiled: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+
+def _import_numba() -> Any:
+    """Import numba, raising a helpful error when it is not installed."""
+    try:
+        import numba
+    except ImportError as exc:
+        raise ImportError(
+            "jit operations require numba and numpy, install them with `pip install memiter[jit]`."
+        ) from exc
+
+    return numba
+
+
+@lru_cache(maxsize=None)
+def _apply_kernel() -> Any:
+    """Compile the parallel kernel that applies a jitted function to every element of an array."""
+    numba = _import_numba()
+
+    @numba.njit(parallel=True)
+    def apply(func, array, out):  # noqa: ANN001, ANN202
+        for i in numba.prange(array.shape[0]):
+            out[i] = func(array[i])
+
+    return apply
+
+
+def compile_func(func: Callable[[T], Any]) -> Any:
+    """Compile a function with numba, reusing the compiled function for the same code and captured values.
+
+    Keyed by code rather than by function object, so a lambda created on every call is compiled only once.
+    The captured closure, defaults and globals are part of the key, since numba freezes them at compile time.
+    """
+    njit = _import_numba().njit
+
+    if not hasattr(func, "__code__"):
+        raise TypeError(
+            f"{func!r} is not a Python function and cannot be compiled by numba."
+        )
+
+    code = func.__code__  # type: ignore [attr-defined]
+
+    try:
+        closure = tuple(cell.cell_contents for cell in func.__closure__ or ())  # type: ignore [attr-defined]
+        global_values = tuple(func.__globals__.get(name) for name in code.co_names)  # type: ignore [attr-defined]
+        key = (code, closure, global_values, func.__defaults__)  # type: ignore [attr-defined]
+        hash(key)
+    except (TypeError, ValueError):
+        return njit(func)
+
+    if key in _compiled:
+        _compiled.move_to_end(key)
+        return _compiled[key]
+
+    _compiled[key] = jitted = njit(func)
+    if len(_compiled) > CACHE_SIZE:
+        _compiled.popitem(last=False)
+
+    return jitted
+
+
+def numeric_array(values: list[T]) -> Any:
+    """Convert the values to a numpy array, return `None` when they are empty or not a flat numeric sequence."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        return None
+
+    if not array.size or array.ndim != 1 or array.dtype.kind not in NUMERIC_KINDS:
+        return None
+
+    return array
+
+
+def _apply(jitted: Any, values: list[T], dtype: Any = None) -> Any:
+    """Apply the jitted function to every value, return the input and output arrays.
+
+    Returns `None` when the values are empty or not a flat numeric sequence.
+    """
+    import numpy as np
+
+    array = numeric_array(values)
+    if array is None:
+        return None
+
+    if dtype is None:
+        dtype = np.asarray(jitted(array[0])).dtype
+
+    out = np.empty(array.shape[0], dtype=dtype)
+    _apply_kernel()(jitted, array, out)
+    return array, out
+
+
+def jit_map(jitted: Any, iterable: Iterable[T]) -> Iterator[Any]:
+    """Map the iterable with a jitted function, falling back to `map` for non-numeric data."""
+    values = list(iterable)
+    arrays = _apply(jitted, values)
+    if arrays is None:
+        return map(jitted.py_func, values)
+
+    return iter(arrays[1].tolist())
+
+
+def jit_filter(jitted: Any, iterable: Iterable[T]) -> Iterator[T]:
+    """Filter the iterable with a jitted predicate, falling back to `filter` for non-numeric data."""
+    values = list(iterable)
+    arrays = _apply(jitted, values, dtype=bool)
+    if arrays is None:
+        return filter(jitted.py_func, values)
+
+    mask = arrays[1]
+    return compress(values, mask.tolist())
+
+
+def vectorized_filter(func: Callable[[Any], Any], iterable: Iterable[T]) -> Iterator[T]:
+    """Filter the iterable with a predicate evaluated once over the whole numpy array.
+
+    Falls back to `filter` when numpy is missing, the data is not numeric, or the predicate does not vectorize.
+    Integer arithmetic is fixed width, overflowing results wrap around silently.
+    """
+    values = list(iterable)
+    array = numeric_array(values)
+    if array is None:
+        return filter(func, values)
+
+    import numpy as np
+
+    try:
+        with np.errstate(all="raise"):
+            mask = np.asarray(func(array), dtype=bool)
+    except Exception:  # noqa: BLE001
+        # Any failure over the whole array, including floating point errors, means the predicate does not vectorize.
+        return filter(func, values)
+
+    if mask.shape != array.shape:
+        return filter(func, values)
+
+    return compress(values, mask.tolist())
@@ -1,3 +1,8 @@
+import operator
+import sys
+
+import pytest
+
 from memiter import memiter
 
 
@@ -67,3 +72,114 @@ def test_wrapping_instances():
     paged = gen.limit(2).page(5)
     wrapped_gen = memiter(paged).limit(1).page(2)
     assert list(wrapped_gen) == [9], "Expected [9], but got {wrapped_gen}"
+
+
+def test_data_after_repeated_iteration() -> None:
+    gen = memiter(range(10)).limit(3)
+    assert list(gen) == list(gen) == [0, 1, 2]
+    assert gen.data == [0, 1, 2], f"Expected [0, 1, 2], but got {gen.data}"
+
+
+def test_data_before_iteration() -> None:
+    gen = memiter(iter(range(10))).filter(lambda x: x % 2 == 0).limit(2)
+    assert gen.data == [0, 2], f"Expected [0, 2], but got {gen.data}"
+    assert list(gen) == [0, 2], f"Expected [0, 2], but got {list(gen)}"
+
+
+def test_batches() -> None:
+    gen = memiter(range(10)).filter(lambda x: x % 2 == 0)
+    batches = list(gen.batches(2))
+    assert batches == [[0, 2], [4, 6], [8]], f"Expected [[0, 2], [4, 6], [8]], but got {batches}"
+
+
+def test_batches_store() -> None:
+    gen = memiter(iter(range(10))).limit(5)
+    batches = list(gen.batches(3, store=True))
+    assert batches == [[0, 1, 2], [3, 4]], f"Expected [[0, 1, 2], [3, 4]], but got {batches}"
+    assert gen.data == [0, 1, 2, 3, 4], f"Expected [0, 1, 2, 3, 4], but got {gen.data}"
+
+
+def test_first_empty() -> None:
+    gen = memiter(range(10)).filter(lambda x: x > 10)
+    assert gen.first() is None, f"Expected None, but got {gen.first()}"
+    assert gen.data == [], f"Expected [], but got {gen.data}"
+
+
+def test_cache() -> None:
+    gen = memiter(iter(range(10))).limit(5).page(2).cache()
+    assert list(gen) == [5, 6, 7, 8, 9], f"Expected [5, 6, 7, 8, 9], but got {list(gen)}"
+    assert list(gen.filter(lambda x: x % 2 == 0)) == [6, 8], f"Expected [6, 8], but got {gen.data}"
+
+
+def test_order_by_page() -> None:
+    gen = memiter(range(10)).limit(3).page(2).order_by(lambda x: -x)
+    assert list(gen) == [5, 4, 3], f"Expected [5, 4, 3], but got {list(gen)}"
+
+
+def test_map_op() -> None:
+    gen = memiter(range(5)).map_op(operator.sub, 1)
+    assert list(gen) == [-1, 0, 1, 2, 3], f"Expected [-1, 0, 1, 2, 3], but got {list(gen)}"
+
+
+def test_filter_mod_eq() -> None:
+    gen = memiter(range(10)).filter_mod_eq(3, 1).map_op(operator.mul, 2).limit(2)
+    assert list(gen) == [2, 8], f"Expected [2, 8], but got {list(gen)}"
+
+
+def test_data_after_next() -> None:
+    gen = memiter(range(5))
+    next(gen)
+    next(gen)
+    assert gen.data == [0, 1, 2, 3, 4], f"Expected [0, 1, 2, 3, 4], but got {gen.data}"
+
+
+def test_filter_during_iteration() -> None:
+    gen = memiter(range(10))
+    next(gen)
+    gen.filter(lambda x: x % 2 == 0)
+    assert list(gen) == [2, 4, 6, 8], f"Expected [2, 4, 6, 8], but got {list(gen)}"
+    assert list(gen) == [0, 2, 4, 6, 8], f"Expected [0, 2, 4, 6, 8], but got {list(gen)}"
+
+
+def test_vectorized_filter_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    gen = memiter([1, 2.5, 3, 4]).filter(lambda x: x > 2, vectorized=True)
+    assert list(gen) == [2.5, 3, 4], f"Expected [2.5, 3, 4], but got {list(gen)}"
+
+
+def test_batches_invalid_chunk_size() -> None:
+    with pytest.raises(AssertionError):
+        memiter(range(10)).batches(0)
+
+
+def test_mutating_data_after_cache() -> None:
+    gen = memiter(range(5)).cache()
+    gen.data.append(99)
+    assert list(gen) == [0, 1, 2, 3, 4], f"Expected [0, 1, 2, 3, 4], but got {list(gen)}"
+
+
+def test_mutating_data_after_order_by() -> None:
+    gen = memiter([3, 1, 2]).order_by()
+    gen.data.clear()
+    assert list(gen) == [1, 2, 3], f"Expected [1, 2, 3], but got {list(gen)}"
+
+
+def test_data_after_iteration_does_not_rerun() -> None:
+    calls = []
+
+    def double(x: int) -> int:
+        calls.append(x)
+        return x * 2
+
+    gen = memiter(range(5)).map(double)
+    assert list(gen) == [0, 2, 4, 6, 8], f"Expected [0, 2, 4, 6, 8], but got {list(gen)}"
+    assert gen.data == [0, 2, 4, 6, 8], f"Expected [0, 2, 4, 6, 8], but got {gen.data}"
+    assert len(calls) == 5, f"Expected 5 calls, but got {len(calls)}"
+
+
+def test_data_after_altered_iteration() -> None:
+    gen = memiter(range(6))
+    next(gen)
+    gen.limit(2)
+    assert list(gen) == [1, 2, 3, 4, 5], f"Expected [1, 2, 3, 4, 5], but got {list(gen)}"
+    assert gen.data == [0, 1], f"Expected [0, 1], but got {gen.data}"
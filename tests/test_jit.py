@@ -0,0 +1,47 @@
+import pytest
+
+from memiter import memiter
+
+pytest.importorskip("numba")
+
+
+def test_map_jit() -> None:
+    gen = memiter(range(5)).map_jit(lambda x: x * 2)
+    assert list(gen) == [0, 2, 4, 6, 8], f"Expected [0, 2, 4, 6, 8], but got {list(gen)}"
+
+
+def test_filter_jit() -> None:
+    gen = memiter(range(10)).filter_jit(lambda x: x % 2 == 0)
+    assert list(gen) == [0, 2, 4, 6, 8], f"Expected [0, 2, 4, 6, 8], but got {list(gen)}"
+
+
+def test_jit_pagination() -> None:
+    gen = memiter(range(20)).filter_jit(lambda x: x % 2 == 0).map_jit(lambda x: x * 2).limit(3).page(2)
+    assert list(gen) == [12, 16, 20], f"Expected [12, 16, 20], but got {list(gen)}"
+    assert gen.data == [12, 16, 20], f"Expected [12, 16, 20], but got {gen.data}"
+
+
+def test_jit_closure() -> None:
+    def above(n: int) -> list[int]:
+        return list(memiter(range(5)).filter_jit(lambda x: x > n))
+
+    assert above(2) == [3, 4], f"Expected [3, 4], but got {above(2)}"
+    assert above(3) == [4], f"Expected [4], but got {above(3)}"
+
+
+def test_jit_non_numeric_fallback() -> None:
+    gen = memiter(["a", "bb", "ccc"]).map_jit(lambda x: len(x))
+    assert list(gen) == [1, 2, 3], f"Expected [1, 2, 3], but got {list(gen)}"
+
+
+def test_jit_builtin_func() -> None:
+    with pytest.raises(TypeError):
+        memiter(range(5)).map_jit(abs)
+
+
+def test_filter_jit_keeps_elements() -> None:
+    gen = memiter([1, 2.5, 3]).filter_jit(lambda x: x > 0)
+    result = list(gen)
+    assert result == [1, 2.5, 3], f"Expected [1, 2.5, 3], but got {result}"
+    types = [type(item) for item in result]
+    assert types == [int, float, int], f"Expected [int, float, int], but got {types}"
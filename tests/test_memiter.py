@@ -95,3 +95,9 @@ def test_invalid_page(deck: TestDeck) -> None:
     """Test setting an invalid page."""
     with pytest.raises(AssertionError):
         memiter(deck.deck).page(0)
+
+
+def test_invalid_iterable() -> None:
+    """Test creating a memiter instance from a non-iterable."""
+    with pytest.raises(TypeError):
+        memiter(42)  # type: ignore [arg-type]
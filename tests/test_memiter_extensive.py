@@ -1,3 +1,5 @@
+from itertools import count, islice
+
 from memiter import memiter
 
 
@@ -52,3 +54,52 @@ def test_memiter_custom_object() -> None:
     iterable = [Person("Alice"), Person("Bob"), Person("Charlie")]
     result = list(memiter(iterable))
     assert result == iterable.copy()
+
+
+def test_memiter_generator_function_reiteration() -> None:
+    # Test re-iterating a memiter built from a generator function
+    def numbers():
+        yield from range(5)
+
+    gen = memiter(numbers()).filter(lambda x: x % 2 == 0)
+    assert list(gen) == [0, 2, 4]
+    assert list(gen) == [0, 2, 4]
+
+
+def test_memiter_generator_reset() -> None:
+    # Test resetting a memiter built from a one-shot iterator
+    gen = memiter(iter(range(5))).limit(2).page(2)
+    assert list(gen) == [2, 3]
+    assert list(gen.reset()) == [0, 1, 2, 3, 4]
+
+
+def test_memiter_order_by_reset() -> None:
+    # Test resetting a memiter after order_by replaced its source
+    gen = memiter(iter([3, 1, 2])).order_by()
+    assert list(gen) == [1, 2, 3]
+    assert list(gen.reset()) == [3, 1, 2]
+
+
+def test_memiter_lazy_iteration() -> None:
+    # Test that iterating an infinite iterable is lazy
+    gen = memiter(count())
+    assert iter(gen) is gen
+    assert list(islice(gen, 3)) == [0, 1, 2]
+
+    for item in memiter(count()):
+        if item == 4:
+            break
+
+    assert item == 4
+
+
+def test_memiter_list_subclass() -> None:
+    # Test that list subclasses are iterated through their own __iter__
+    class Scaled(list):
+        def __iter__(self):
+            return (item * 100 for item in super().__iter__())
+
+    iterable = Scaled([1, 2, 3])
+    assert list(memiter(iterable)) == [100, 200, 300]
+    assert list(memiter(iterable).limit(2)) == [100, 200]
+    assert list(memiter(iterable).limit(2).reset()) == [100, 200, 300]
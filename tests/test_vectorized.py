@@ -0,0 +1,31 @@
+import pytest
+
+from memiter import memiter
+
+pytest.importorskip("numpy")
+
+
+def test_vectorized_filter() -> None:
+    gen = memiter(range(10)).filter(lambda x: x % 2 == 0, vectorized=True).limit(3)
+    assert list(gen) == [0, 2, 4], f"Expected [0, 2, 4], but got {list(gen)}"
+
+
+def test_vectorized_filter_fallback() -> None:
+    gen = memiter(range(10)).filter(lambda x: x > 2 and x < 5, vectorized=True)
+    assert list(gen) == [3, 4], f"Expected [3, 4], but got {list(gen)}"
+
+
+def test_vectorized_filter_attribute_error_fallback() -> None:
+    gen = memiter([1.0, 2.5]).filter(lambda x: x.is_integer(), vectorized=True)
+    assert list(gen) == [1.0], f"Expected [1.0], but got {list(gen)}"
+
+
+def test_vectorized_filter_overflow_fallback() -> None:
+    gen = memiter([1, 2]).filter(lambda x: x * 2**70 > 0, vectorized=True)
+    assert list(gen) == [1, 2], f"Expected [1, 2], but got {list(gen)}"
+
+
+def test_vectorized_filter_floating_point_error_fallback() -> None:
+    gen = memiter([1, 2, 3]).filter(lambda x: 1 / (x - 2) > 0, vectorized=True)
+    with pytest.raises(ZeroDivisionError):
+        list(gen)